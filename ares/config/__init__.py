@@ -29,7 +29,7 @@ def ensure_config_dir():
 USER_CONFIG_DIR = None  # Will be set when needed
 
 # Rest of imports
-from .config import config, get_config
+from .config import get_config
 from .config_manager import ConfigManager
 from .engine_config import EngineConfig
 from .build_config import BuildConfig
@@ -40,14 +40,31 @@ from .package_config import PackageConfig
 from .assets_config import AssetsConfig
 from .logging_config import LoggingConfig
 
-# Create global instances
-engine_config = EngineConfig()
-build_config = BuildConfig()
-project_config = ProjectConfig()
-package_config = PackageConfig()
-assets_config = AssetsConfig()
-compiler_config = CompilerConfig()
-logging_config = LoggingConfig()
+# Global instances are created on first access through __getattr__ so that
+# importing this package does no config file I/O. The submodule attributes
+# bound by the imports above share these names and are dropped first.
+_GLOBAL_CONFIG_FACTORIES = {
+    'config': get_config,
+    'engine_config': EngineConfig,
+    'build_config': BuildConfig,
+    'project_config': ProjectConfig,
+    'package_config': PackageConfig,
+    'assets_config': AssetsConfig,
+    'compiler_config': CompilerConfig,
+    'logging_config': LoggingConfig,
+}
+for _name in _GLOBAL_CONFIG_FACTORIES:
+    globals().pop(_name, None)
+del _name
+
+def __getattr__(name):
+    """Create a global config instance the first time it is accessed."""
+    factory = _GLOBAL_CONFIG_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        
+    instance = globals()[name] = factory()
+    return instance
 
 # Flag to track initialization status
 _initialized = False
@@ -64,15 +81,7 @@ def initialize() -> bool:
         # Lazily create config directories now
         USER_CONFIG_DIR = ensure_config_dir()
         
-        # Make sure all configs are loaded
-        engine_config.load()
-        build_config.load()
-        project_config.load()
-        package_config.load()
-        compiler_config.load()
-        assets_config.load()
-        logging_config.load()
-        
+        # Config instances load their files when first accessed
         _initialized = True
     
     return _initialized
@@ -0,0 +1,95 @@
+"""Prebuilt snapshot cache for parsed INI files."""
+
+import os
+import mmap
+import locale
+import zlib
+import pickle
+import configparser
+from pathlib import Path
+
+from .fast_ini import parse_ini
+
+# Snapshots live under the user's cache directory, outside the config folders
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ares"
+
+def _snapshot_path(ini_path, cache_dir):
+    """Return the snapshot file for an INI path; same-named files do not collide."""
+    return Path(cache_dir) / f"{ini_path.stem}-{zlib.crc32(str(ini_path).encode()):08x}.pkl"
+
+def _read_snapshot(snapshot_file):
+    """Unpickle a snapshot straight from a memory map of the file."""
+    with open(snapshot_file, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm)
+
+def _write_snapshot(snapshot_file, payload):
+    """Write a snapshot atomically so readers never see a partial file."""
+    tmp_file = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}.tmp")
+    try:
+        # The cache is best-effort, so an unusable cache directory is ignored too
+        os.makedirs(snapshot_file.parent, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, snapshot_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+def _decode(data):
+    """Decode INI bytes as UTF-8, or in the locale encoding older configs were written in.
+    
+    Raises:
+        UnicodeDecodeError: If the bytes are valid in neither encoding
+    """
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode(locale.getpreferredencoding(False))
+
+def _parse_with_configparser(text, source):
+    """Parse INI text the fast parser rejects, keeping each section's own options only.
+    
+    DEFAULT is read as an ordinary section, so options a section sets to the
+    same value as DEFAULT are kept instead of being mistaken for inherited ones.
+    """
+    file_parser = configparser.ConfigParser(default_section="\0no default section")
+    file_parser.read_string(text, source=source)
+    values = {configparser.DEFAULTSECT: {}}
+    for section in file_parser.sections():
+        values[section] = dict(file_parser.items(section, raw=True))
+    return values
+
+def load_or_build(ini_path, cache_dir=None):
+    """Read an INI file's values, using the prebuilt snapshot when it is current.
+    
+    Args:
+        ini_path: Path to the INI file
+        cache_dir: Directory holding the snapshot files (defaults to CACHE_DIR)
+        
+    Returns:
+        dict: Raw option values keyed by section
+    """
+    ini_path = Path(ini_path)
+    stat = ini_path.stat()
+    fingerprint = (str(ini_path), stat.st_mtime_ns, stat.st_size)
+    snapshot_file = _snapshot_path(ini_path, cache_dir or CACHE_DIR)
+    
+    # Reuse the snapshot if the INI file is unchanged since it was written
+    try:
+        cached_fingerprint, values = _read_snapshot(snapshot_file)
+        if cached_fingerprint == fingerprint:
+            return values
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+        
+    # Files the fast parser rejects fall back to configparser on the same text
+    text = _decode(ini_path.read_bytes())
+    values = parse_ini(text)
+    if values is None:
+        values = _parse_with_configparser(text, str(ini_path))
+        
+    _write_snapshot(snapshot_file, (fingerprint, values))
+    return values
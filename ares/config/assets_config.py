@@ -2,56 +2,107 @@
 Asset configuration settings for the Ares Engine project.
 """
 
+import os
+import re
+import fnmatch
+from pathlib import PurePath
+from types import MappingProxyType
+
 from .base_config import BaseConfig
 
+_ASSETS_DEFAULTS = MappingProxyType({
+    "assets": MappingProxyType({
+        "compress_textures": True,
+        "audio_quality": "medium",
+        "bundle_assets": True,
+        "exclude_patterns": "*.psd, *.xcf, *.blend, *.max, *.mb, *.ma, *.fbx",
+        "include_source_maps": False,
+        "convert_models": True,
+        "optimize_assets": True,
+        "asset_compression": "zlib",
+    }),
+})
+
 class AssetsConfig(BaseConfig):
 
+    __slots__ = ()
+    _DEFAULTS = _ASSETS_DEFAULTS
+
     def __init__(self):
         super().__init__("assets")
-        self._create_default_config()
-
-    def _create_default_config(self):
-        """Create default asset configuration."""
-        self.set("assets", "compress_textures", "True")
-        self.set("assets", "audio_quality", "medium")
-        self.set("assets", "bundle_assets", "True")
-        self.set("assets", "exclude_patterns", "*.psd, *.xcf, *.blend, *.max, *.mb, *.ma, *.fbx")
-        self.set("assets", "include_source_maps", "False")
-        self.set("assets", "convert_models", "True")
-        self.set("assets", "optimize_assets", "True")
-        self.set("assets", "asset_compression", "zlib")
     
     def should_compress_textures(self):
         """Check if texture compression is enabled."""
-        return self.get_bool("assets", "compress_textures", True)
+        return self.get_bool("compress_textures", True, "assets")
     
     def get_audio_quality(self):
         """Get the audio quality setting."""
-        return self.get("assets", "audio_quality", "medium")
+        return self.get("audio_quality", "medium", "assets")
     
     def should_bundle_assets(self):
         """Check if assets should be bundled with the executable."""
-        return self.get_bool("assets", "bundle_assets", True)
+        return self.get_bool("bundle_assets", True, "assets")
     
     def get_exclude_patterns(self):
         """Get list of file patterns to exclude from asset processing."""
-        patterns = self.get("assets", "exclude_patterns", "")
+        patterns = self.get("exclude_patterns", "", "assets")
         return [p.strip() for p in patterns.split(",") if p.strip()]
     
+    def split_excludes_by_prefix(self):
+        """Group exclude patterns by the literal directory prefix before their first wildcard.
+        
+        Returns:
+            dict: Prefix such as "assets/textures/" ("" when there is none) mapped
+                  to the compiled patterns that can only match below it
+        """
+        excludes = {}
+        for pattern in self.get_exclude_patterns():
+            pattern = pattern.replace("\\", "/")
+            wildcard = re.search(r"[*?\[]", pattern)
+            literal = pattern[:wildcard.start()] if wildcard else pattern
+            prefix = literal[:literal.rfind("/") + 1]
+            excludes.setdefault(prefix, []).append(re.compile(fnmatch.translate(pattern)))
+        return excludes
+    
+    @staticmethod
+    def is_excluded(path, excludes_by_prefix):
+        """Check a relative asset path against the patterns whose prefix contains it.
+        
+        Args:
+            path: Asset path relative to the asset root
+            excludes_by_prefix: Result of split_excludes_by_prefix()
+            
+        Returns:
+            bool: True if any relevant exclude pattern matches the path
+        """
+        # Path objects convert their own separators; plain strings may mix them
+        path = path.as_posix() if isinstance(path, PurePath) else os.fspath(path).replace("\\", "/")
+        
+        # Only look up the prefixes that are parent directories of this path
+        end = 0
+        while end != -1:
+            for pattern in excludes_by_prefix.get(path[:end], ()):
+                if pattern.match(path):
+                    return True
+            end = path.find("/", end) + 1 or -1
+        return False
+    
     def get_asset_compression(self):
         """Get asset compression method."""
-        return self.get("assets", "asset_compression", "zlib")
+        return self.get("asset_compression", "zlib", "assets")
     
     def get_override_dict(self):
         """Get dictionary of important configuration values."""
-        return {
-            "compress_textures": self.should_compress_textures(),
-            "audio_quality": self.get_audio_quality(),
-            "bundle_assets": self.should_bundle_assets(),
-            "exclude_patterns": self.get_exclude_patterns(),
-            "asset_compression": self.get_asset_compression(),
-            "optimize_assets": self.get_bool("assets", "optimize_assets", True)
-        }
+        if self._override_dict is None:
+            self._override_dict = {
+                "compress_textures": self.should_compress_textures(),
+                "audio_quality": self.get_audio_quality(),
+                "bundle_assets": self.should_bundle_assets(),
+                "exclude_patterns": self.get_exclude_patterns(),
+                "asset_compression": self.get_asset_compression(),
+                "optimize_assets": self.get_bool("optimize_assets", True, "assets")
+            }
+        return self._copy_override_dict()
     
     def initialize(self, *args, **kwargs):
         """Initialize this configuration."""
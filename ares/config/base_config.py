@@ -1,15 +1,89 @@
 """Base configuration classes for Ares Engine."""
 
+import io
 import os
+import sys
+import inspect
+import logging
 import configparser
 from pathlib import Path
 
 # Use the function instead of direct import to avoid circular dependencies
 from ares.utils.paths import get_user_config_dir
 
+from ._cache import load_or_build
+from .fast_ini import parser_to_dict
+
+log = logging.getLogger(__name__)
+
+# Strings accepted as true by get_bool and the typed value cache
+TRUE_VALUES = ('true', 'yes', 'y', '1', 'on', 't')
+
+# Pre-built strings for the small integers config values commonly hold
+_INT_STRINGS = {i: str(i) for i in range(-1, 256)}
+
+def _to_config_str(value):
+    """Convert a value to the string form stored in the parser."""
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is bool:
+        return "True" if value else "False"
+    if value_type is int:
+        return _INT_STRINGS.get(value) or str(value)
+    return str(value)
+
+def _fast_write(data, path):
+    """Write nested section/option values to an INI file in one call."""
+    buf = io.StringIO()
+    for section, options in data.items():
+        if not options and section == configparser.DEFAULTSECT:
+            continue
+        buf.write(f"[{section}]\n")
+        for key, value in options.items():
+            # Continuation lines of multi-line values must be indented
+            value = value.replace("\n", "\n\t")
+            buf.write(f"{key} = {value}\n")
+        buf.write("\n")
+        
+    # Written as UTF-8, which load_or_build decodes before trying the locale encoding
+    Path(path).write_text(buf.getvalue(), encoding="utf-8")
+
 class BaseConfig:
     """Base configuration class used by specialized config classes."""
     
+    __slots__ = (
+        "config_dir", "config_name", "config_file", "section", "parser",
+        "_values", "_typed", "_override_cache", "_override_dict", "_initialized",
+    )
+    
+    # Shared instances keyed by (class, config_name) so that constructing a
+    # config a second time reuses the loaded object instead of re-reading the file
+    _instances = {}
+    
+    # Typed default values keyed by section then option name. Their types
+    # also decide which options are converted once into the typed cache
+    _DEFAULTS = {}
+    
+    # String forms of each class's _DEFAULTS, built once per class
+    _string_defaults = {}
+    
+    # Default config_name of each class's __init__, looked up once per class
+    _default_names = {}
+    
+    def __new__(cls, config_name=None, *args, **kwargs):
+        """Return the cached instance for this class and config name."""
+        # Key on the name __init__ will actually use, so Config() and
+        # Config("config") share the instance for the same file
+        if config_name is None:
+            config_name = cls._get_default_name()
+        key = (cls, config_name)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[key] = instance
+        return instance
+    
     def __init__(self, config_name, section="DEFAULT"):
         """Initialize with config file name and section.
         
@@ -17,15 +91,63 @@ class BaseConfig:
             config_name: Name of configuration (used for filename without .ini)
             section: Section name in the INI file (default: DEFAULT)
         """
-        # Get user config directory using the function
+        # Shared instances are only initialized once
+        if getattr(self, "_initialized", False):
+            return
+            
+        # Get user config directory using the function, which creates it
         self.config_dir = get_user_config_dir()
-        os.makedirs(self.config_dir, exist_ok=True)
         
         self.config_name = config_name
         self.config_file = self.config_dir / f"{config_name}.ini"
         self.section = section
         self.parser = configparser.ConfigParser()
-        self.loaded = False
+        self._typed = {}
+        
+        # Interpolated values keyed by section then option name, served by get()
+        self._values = {}
+        
+        # Override file path -> ((mtime_ns, size), result) of its last application
+        self._override_cache = {}
+        
+        # Result of get_override_dict, cleared whenever a value changes
+        self._override_dict = None
+        
+        # Defaults first so that values from the file take precedence
+        self._create_default_config()
+        self.load()
+        self._initialized = True
+        
+    @classmethod
+    def _get_default_name(cls):
+        """Return the config_name default of the class's __init__, or None without one."""
+        try:
+            return BaseConfig._default_names[cls]
+        except KeyError:
+            pass
+            
+        parameter = inspect.signature(cls.__init__).parameters.get("config_name")
+        if parameter is None or parameter.default is inspect.Parameter.empty:
+            name = None
+        else:
+            name = parameter.default
+        BaseConfig._default_names[cls] = name
+        return name
+        
+    @classmethod
+    def _get_string_defaults(cls):
+        """Return the class defaults converted to the strings the parser stores."""
+        defaults = BaseConfig._string_defaults.get(cls)
+        if defaults is None:
+            defaults = BaseConfig._string_defaults[cls] = {
+                section: {key: _to_config_str(value) for key, value in options.items()}
+                for section, options in cls._DEFAULTS.items()
+            }
+        return defaults
+        
+    def _create_default_config(self):
+        """Apply the class defaults to the parser before any file is loaded."""
+        self.parser.read_dict(self._get_string_defaults())
         
     def ensure_section_exists(self):
         """Ensure the section exists in the config parser."""
@@ -36,18 +158,88 @@ class BaseConfig:
         """Load configuration from file."""
         self.ensure_section_exists()
             
-        # Try to load from file if it exists
-        if self.config_file.exists():
-            try:
-                self.parser.read(self.config_file)
-                self.loaded = True
-                return True
-            except configparser.Error:
-                print(f"Warning: Could not parse config file {self.config_file}")
-                return False
-        
-        self.loaded = True
+        # Try to load from file if it exists; load_or_build stats it anyway,
+        # so a missing or unreadable file is skipped there instead of being
+        # checked by a separate exists()
+        try:
+            self.parser.read_dict(load_or_build(self.config_file))
+        except OSError:
+            pass
+        except (configparser.Error, UnicodeDecodeError):
+            log.warning("Could not parse config file %s", self.config_file)
+            return False
+        finally:
+            # Values derived from the config must exist even when the file
+            # could not be parsed, so build them from whatever was loaded
+            self._build_snapshot()
+            self._build_typed_values()
         return True  # Return success even if file doesn't exist
+        
+    def _build_snapshot(self, section=None):
+        """Copy interpolated parser values into plain dicts for fast lookups.
+        
+        Args:
+            section: Only rebuild this section (defaults to every section)
+        """
+        for name in (self.parser if section is None else (section,)):
+            values = {}
+            for key in self.parser[name]:
+                # Values that cannot be interpolated are left to the parser
+                try:
+                    value = self.parser.get(name, key)
+                except configparser.InterpolationError:
+                    continue
+                    
+                # Interned keys are the same objects as the literal names the
+                # getters pass, so lookups match on identity
+                values[sys.intern(key)] = value
+            self._values[sys.intern(name)] = values
+            
+    def _build_typed_values(self):
+        """Convert every option with a typed default to its Python type."""
+        self._typed = {}
+        for section, options in self._DEFAULTS.items():
+            for key in options:
+                self._cache_typed_value(section, key)
+        self._refresh_derived_values()
+                
+    def _refresh_derived_values(self, section=None):
+        """Reset values computed from the config; called whenever values change.
+        
+        Args:
+            section: The only section that changed (defaults to all of them)
+        """
+        self._override_dict = None
+        
+    def _copy_override_dict(self):
+        """Return a copy of the cached override dict that callers may modify.
+        
+        List values are copied too, so changes to one result cannot leak
+        into the cache or into later results.
+        """
+        return {
+            key: list(value) if type(value) is list else value
+            for key, value in self._override_dict.items()
+        }
+        
+    def _cache_typed_value(self, section, key):
+        """Store the typed form of a single option if its default is typed."""
+        value_type = type(self._DEFAULTS.get(section, {}).get(key))
+        if value_type not in (bool, int, float):
+            return
+            
+        self._typed.pop((section, key), None)
+        if section not in self.parser or key not in self.parser[section]:
+            return
+            
+        value = self.parser[section][key]
+        if value_type is bool:
+            self._typed[(section, key)] = value.lower() in TRUE_VALUES
+        else:
+            try:
+                self._typed[(section, key)] = value_type(value)
+            except ValueError:
+                pass
                     
     def save(self):
         """Save configuration to file."""
@@ -55,11 +247,10 @@ class BaseConfig:
         
         try:
             os.makedirs(self.config_dir, exist_ok=True)
-            with open(self.config_file, 'w') as config_file:
-                self.parser.write(config_file)
+            _fast_write(parser_to_dict(self.parser), self.config_file)
             return True
         except (OSError, PermissionError) as e:
-            print(f"Error saving config to {self.config_file}: {e}")
+            log.error("Error saving config to %s: %s", self.config_file, e)
             return False
     
     def get(self, key, default=None, section=None):
@@ -73,11 +264,13 @@ class BaseConfig:
         Returns:
             Configuration value or default if not found
         """
-        if not self.loaded:
-            self.load()
-            
         section = section or self.section
         
+        try:
+            return self._values[section][key]
+        except KeyError:
+            pass
+            
         if section in self.parser and key in self.parser[section]:
             return self.parser[section][key]
         
@@ -94,8 +287,12 @@ class BaseConfig:
         Returns:
             bool: Configuration value as boolean
         """
+        typed = self._typed.get((section or self.section, key))
+        if typed is not None:
+            return typed
+            
         value = self.get(key, str(default), section)
-        return value.lower() in ('true', 'yes', 'y', '1', 'on', 't')
+        return value.lower() in TRUE_VALUES
         
     def get_int(self, key, default=0, section=None):
         """Get an integer configuration value.
@@ -108,6 +305,10 @@ class BaseConfig:
         Returns:
             int: Configuration value as integer
         """
+        typed = self._typed.get((section or self.section, key))
+        if typed is not None:
+            return typed
+            
         try:
             return int(self.get(key, default, section))
         except ValueError:
@@ -124,6 +325,10 @@ class BaseConfig:
         Returns:
             float: Configuration value as float
         """
+        typed = self._typed.get((section or self.section, key))
+        if typed is not None:
+            return typed
+            
         try:
             return float(self.get(key, default, section))
         except ValueError:
@@ -140,17 +345,21 @@ class BaseConfig:
         Returns:
             bool: Whether the value was set successfully
         """
-        if not self.loaded:
-            self.load()
-            
         section = section or self.section
         
-        # Ensure section exists
-        if not section in self.parser:
-            self.parser[section] = {}
+        # Store value as string, creating the section only when it is missing
+        value = _to_config_str(value)
+        try:
+            self.parser.set(section, key, value)
+        except configparser.NoSectionError:
+            self.parser.add_section(section)
+            self.parser.set(section, key, value)
             
-        # Store value as string
-        self.parser[section][key] = str(value)
+        # DEFAULT values are inherited by every section, so refresh them all
+        changed = None if section == self.parser.default_section else section
+        self._build_snapshot(changed)
+        self._cache_typed_value(section, key)
+        self._refresh_derived_values(changed)
         return True
         
     def get_section(self, section=None):
@@ -162,15 +371,8 @@ class BaseConfig:
         Returns:
             dict: Dictionary of key-value pairs in the section
         """
-        if not self.loaded:
-            self.load()
-            
         section = section or self.section
-        
-        if section in self.parser:
-            return dict(self.parser[section])
-        
-        return {}
+        return dict(self._values.get(section, {}))
         
     def load_overrides(self, filename):
         """Load configuration overrides from an external file.
@@ -184,35 +386,48 @@ class BaseConfig:
                 - "section": name of the section that was overridden
                 - "values": dictionary of overridden values
         """
-        if not self.loaded:
-            self.load()
-            
         result = {
             "overridden": False,
             "section": self.section,
             "values": {}
         }
         
-        if not Path(filename).exists():
+        override_path = Path(filename)
+        try:
+            stat = override_path.stat()
+        except OSError:
             return result
             
-        # Create a new parser for the override file
-        override_parser = configparser.ConfigParser()
+        # Skip re-parsing an override file that has not changed since last applied
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        cached = self._override_cache.get(str(override_path))
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+            
         try:
-            override_parser.read(filename)
-        except configparser.Error:
+            override_values = load_or_build(override_path)
+        except (configparser.Error, UnicodeDecodeError):
             return result
             
+        self._override_cache[str(override_path)] = (fingerprint, result)
+        
         # Check if our section exists
-        if not self.section in override_parser:
+        defaults = override_values.get(configparser.DEFAULTSECT, {})
+        if self.section == configparser.DEFAULTSECT:
+            values = dict(defaults)
+        elif self.section in override_values:
+            values = {**defaults, **override_values[self.section]}
+        else:
             return result
             
-        # Apply overrides
-        for key, value in override_parser[self.section].items():
-            old_value = self.get(key)
-            self.set(key, value)
-            if old_value != value:
-                result["overridden"] = True
-                result["values"][key] = value
-                
+        # Apply all overrides in one pass, recording the options that change
+        current = self.parser[self.section] if self.section in self.parser else {}
+        changed = {key: value for key, value in values.items() if current.get(key) != value}
+        
+        self.parser.read_dict({self.section: values})
+        self._build_snapshot()
+        self._build_typed_values()
+        
+        result["overridden"] = bool(changed)
+        result["values"] = changed
         return result
@@ -2,60 +2,68 @@
 Build configuration settings for the Ares Engine project.
 """
 
+from types import MappingProxyType
+
 from .base_config import BaseConfig
 
+_BUILD_DEFAULTS = MappingProxyType({
+    "build": MappingProxyType({
+        "parallel": True,
+        "inplace": True,
+    }),
+    "resources": MappingProxyType({
+        "include_resources": True,
+        "resource_dir_name": "resources",
+        "compress_resources": True,
+    }),
+    "cython": MappingProxyType({
+        "module_dirs": "core:core modules, math:math modules, physics:physics modules, renderer:renderer modules",
+        "language_level": 3,
+        "boundscheck": False,
+        "wraparound": False,
+        "cdivision": True,
+    }),
+})
+
 class BuildConfig(BaseConfig):
 
+    __slots__ = ()
+    _DEFAULTS = _BUILD_DEFAULTS
+
     def __init__(self):
         super().__init__("build")
-        self._create_default_config()
-        
-    def _create_default_config(self):
-        # Build section
-        self.set("build", "parallel", "True")
-        self.set("build", "inplace", "True")
-        
-        # Resources section
-        self.set("resources", "include_resources", "True")
-        self.set("resources", "resource_dir_name", "resources")
-        self.set("resources", "compress_resources", "True")
-        
-        # Cython section
-        self.set("cython", "module_dirs", "core:core modules, math:math modules, physics:physics modules, renderer:renderer modules")
-        self.set("cython", "language_level", "3")
-        self.set("cython", "boundscheck", "False")
-        self.set("cython", "wraparound", "False")
-        self.set("cython", "cdivision", "True")
     
     def get_resource_dir_name(self):
         """Get the name of the resources directory."""
-        return self.get("resources", "resource_dir_name", "resources")
+        return self.get("resource_dir_name", "resources", "resources")
     
     def should_include_resources(self):
         """Check if resources should be included in builds."""
-        return self.get_bool("resources", "include_resources", True)
+        return self.get_bool("include_resources", True, "resources")
     
     def should_compress_resources(self):
         """Check if resources should be compressed."""
-        return self.get_bool("resources", "compress_resources", True)
+        return self.get_bool("compress_resources", True, "resources")
     
     def get_raw_cython_module_dirs(self):
         """Get the raw Cython module directories string from config."""
-        return self.get("cython", "module_dirs", "")
+        return self.get("module_dirs", "", "cython")
 
     def get_override_dict(self):
         """Get dictionary of important configuration values."""
         # Import Paths instead of non-existent cython_compiler
         from ares.utils.paths import Paths
         
-        return {
-            "parallel": self.get_bool("build", "parallel", True),
-            "inplace": self.get_bool("build", "inplace", True),
-            "include_resources": self.should_include_resources(),
-            "resource_dir_name": self.get_resource_dir_name(),
-            "compress_resources": self.should_compress_resources(),
-            "cython_module_dirs": Paths.get_cython_module_path()
-        }
+        if self._override_dict is None:
+            self._override_dict = {
+                "parallel": self.get_bool("parallel", True, "build"),
+                "inplace": self.get_bool("inplace", True, "build"),
+                "include_resources": self.should_include_resources(),
+                "resource_dir_name": self.get_resource_dir_name(),
+                "compress_resources": self.should_compress_resources(),
+                "cython_module_dirs": Paths.get_cython_module_path()
+            }
+        return self._copy_override_dict()
     
     def initialize(self, *args, **kwargs):
         """Initialize this configuration."""
@@ -2,99 +2,116 @@
 Compiler configuration settings for the Ares Engine project.
 """
 
+from types import MappingProxyType
+
 from .base_config import BaseConfig
 from ares.utils.build.build_utils import BuildUtils
 
+# The platform cannot change during the process lifetime
+_IS_WINDOWS = BuildUtils.is_windows()
+
+_COMPILER_DEFAULTS = MappingProxyType({
+    "compiler": MappingProxyType({
+        "optimization_level": "O3",
+        "debug_symbols": False,
+        "additional_flags": "/favor:AMD64 /DWIN64" if _IS_WINDOWS else "-march=native",
+        "parallel_jobs": 8,
+        "include_dirs": "",
+        "library_dirs": "",
+        "use_ninja": True,
+        "enable_lto": True,
+        "optimize": 3,
+    }),
+    "compiler_flags": MappingProxyType({
+        "common": "",
+        "windows": "/O2 /GL /favor:AMD64 /DWIN64 /EHsc /MP /fp:fast",
+        "unix": "-O3 -march=native -mtune=native -ffast-math -Wall",
+    }),
+})
+
 class CompilerConfig(BaseConfig):
 
+    __slots__ = ("_flag_cache", "_compiler_flags", "_include_dirs", "_library_dirs")
+    _DEFAULTS = _COMPILER_DEFAULTS
+
     def __init__(self):
         super().__init__("compiler")
-        self._create_default_config()
-        
-    def _create_default_config(self):
-        """Create default compiler configuration."""
-        # Compiler section
-        self.set("compiler", "optimization_level", "O3")
-        self.set("compiler", "debug_symbols", "False")
-        self.set("compiler", "additional_flags", "/favor:AMD64 /DWIN64" if BuildUtils.is_windows() else "-march=native")
-        self.set("compiler", "parallel_jobs", "8")
-        self.set("compiler", "include_dirs", "")
-        self.set("compiler", "library_dirs", "")
-        self.set("compiler", "use_ninja", "True")
-        self.set("compiler", "enable_lto", "True")
-        self.set("compiler", "optimize", "3")
-        
-        # Compiler flags section
-        self.set("compiler_flags", "common", "")
-        self.set("compiler_flags", "windows", "/O2 /GL /favor:AMD64 /DWIN64 /EHsc /MP /fp:fast")
-        self.set("compiler_flags", "unix", "-O3 -march=native -mtune=native -ffast-math -Wall")
     
-    def get_compiler_flags(self):
-        """Get compiler flags based on the current platform and settings."""  
-        flags = []
+    def _refresh_derived_values(self, section=None):
+        """Rebuild the flag and directory lists when the values they use change."""
+        super()._refresh_derived_values(section)
         
-        # Skip common flags and only use platform-specific flags
-        if BuildUtils.is_windows():
-            platform_flags = self.get("compiler_flags", "windows", "")
-            if platform_flags:
-                flags.extend(platform_flags.split())
+        # Flag strings are only re-split when the compiler_flags section changes
+        if section in (None, "compiler_flags"):
+            self._flag_cache = {
+                name: tuple(self.get(name, "", "compiler_flags").split())
+                for name in ("common", "windows", "unix")
+            }
+            
+        # Skip common flags and only use platform-specific flags on Windows;
+        # Unix-like systems use both common and unix flags
+        if _IS_WINDOWS:
+            flags = list(self._flag_cache["windows"])
         else:
-            # For Unix-like systems, we can use both common and unix flags
-            common_flags = self.get("compiler_flags", "common", "")
-            if common_flags:
-                flags.extend(common_flags.split())
-                
-            platform_flags = self.get("compiler_flags", "unix", "")
-            if platform_flags:
-                flags.extend(platform_flags.split())
-        
+            flags = [*self._flag_cache["common"], *self._flag_cache["unix"]]
+            
         # Add any debug symbols if needed
-        if self.get_bool("compiler", "debug_symbols", False):
-            if BuildUtils.is_windows():
-                flags.append("/Zi")
-            else:
-                flags.append("-g")
+        if self.get_bool("debug_symbols", False, "compiler"):
+            flags.append("/Zi" if _IS_WINDOWS else "-g")
+            
+        self._compiler_flags = tuple(flags)
         
-        return flags
+        if section in (None, "compiler"):
+            self._include_dirs = self._split_dirs(self.get("include_dirs", "", "compiler"))
+            self._library_dirs = self._split_dirs(self.get("library_dirs", "", "compiler"))
+    
+    @staticmethod
+    def _split_dirs(dirs):
+        """Split a comma-separated directory list into a tuple."""
+        return tuple(dir.strip() for dir in dirs.split(",")) if dirs else ()
+    
+    def get_compiler_flags(self):
+        """Get compiler flags based on the current platform and settings."""  
+        return list(self._compiler_flags)
     
     def use_ninja(self):
         """Check if Ninja build system should be used.""" 
-        return self.get_bool("compiler", "use_ninja", True)
+        return self.get_bool("use_ninja", True, "compiler")
     
     def get_parallel_jobs(self):
         """Get number of parallel compilation jobs.""" 
-        return self.get_int("compiler", "parallel_jobs", 8)
+        return self.get_int("parallel_jobs", 8, "compiler")
     
     def get_optimization_level(self):
         """Get optimization level for compilation.""" 
-        return self.get_int("compiler", "optimize", 3)
+        return self.get_int("optimize", 3, "compiler")
     
     def is_lto_enabled(self):
         """Check if link-time optimization is enabled.""" 
-        return self.get_bool("compiler", "enable_lto", True)
+        return self.get_bool("enable_lto", True, "compiler")
     
     def get_include_dirs(self):
         """Get additional include directories.""" 
-        dirs = self.get("compiler", "include_dirs", "")
-        return [dir.strip() for dir in dirs.split(",")] if dirs else []
+        return list(self._include_dirs)
     
     def get_library_dirs(self):
         """Get additional library directories.""" 
-        dirs = self.get("compiler", "library_dirs", "")
-        return [dir.strip() for dir in dirs.split(",")] if dirs else []
+        return list(self._library_dirs)
     
     def get_override_dict(self):
         """Get dictionary of important configuration values."""
-        return {
-            "optimization_level": self.get("compiler", "optimization_level", "O3"),
-            "debug_symbols": self.get_bool("compiler", "debug_symbols", False),
-            "use_ninja": self.use_ninja(),
-            "parallel_jobs": self.get_parallel_jobs(),
-            "enable_lto": self.is_lto_enabled(),
-            "include_dirs": self.get_include_dirs(),
-            "library_dirs": self.get_library_dirs(),
-            "platform_flags": "windows" if BuildUtils.is_windows() else "unix"
-        }
+        if self._override_dict is None:
+            self._override_dict = {
+                "optimization_level": self.get("optimization_level", "O3", "compiler"),
+                "debug_symbols": self.get_bool("debug_symbols", False, "compiler"),
+                "use_ninja": self.use_ninja(),
+                "parallel_jobs": self.get_parallel_jobs(),
+                "enable_lto": self.is_lto_enabled(),
+                "include_dirs": self.get_include_dirs(),
+                "library_dirs": self.get_library_dirs(),
+                "platform_flags": "windows" if _IS_WINDOWS else "unix"
+            }
+        return self._copy_override_dict()
     
     def initialize(self, *args, **kwargs):
         """Initialize this configuration."""
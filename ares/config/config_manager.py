@@ -2,15 +2,60 @@
 
 import os
 import sys
-import shutil
+import hashlib
+import logging
+import functools
 import platform
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from ares.utils.const import ARES_CHILD_PATH, CONFIG_INI_DIR_NAME
 
 from .config_types import ConfigType
 
+log = logging.getLogger(__name__)
+
+# The platform and its base directories cannot change during the process lifetime
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+
+# Only Linux's sendfile accepts a regular file as its output
+_IS_LINUX = sys.platform.startswith("linux")
+_LOCALAPPDATA = (
+    os.environ.get("LOCALAPPDATA", os.path.join(os.environ["USERPROFILE"], "AppData", "Local"))
+    if _IS_WINDOWS else None
+)
+_HOME = os.path.expanduser("~")
+
+# Whether this is a frozen (PyInstaller) app, and where its bundle is unpacked
+_IS_FROZEN = bool(getattr(sys, 'frozen', False))
+_MEIPASS = Path(sys._MEIPASS) if _IS_FROZEN else None
+
+# Default INI files bundled with a frozen app, at the same place as Paths.get_ini_dir()
+_EMBEDDED_INI_DIR = _MEIPASS.joinpath(ARES_CHILD_PATH, CONFIG_INI_DIR_NAME).resolve() if _IS_FROZEN else None
+
+# Names of the INI files embedded in a frozen app, listed once on first use
+_embedded_manifest = None
+
+# Config file paths already known to exist, so they are not checked again
+_ensured_config_paths = set()
+
+# Written to the config directory once every embedded config has been extracted
+_EXTRACTED_MARKER = ".extracted"
+
+def _build_id():
+    """Identify the running frozen build by its executable's path, size and mtime."""
+    stat = os.stat(sys.executable)
+    key = f"{sys.executable}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
 class ConfigManager:
     """Central class for managing application configurations."""
     
+    # Config objects by name, built by the first get_config_objects call
+    _cached_objects = None
+    
     @classmethod
     def get_app_config_dir(cls, app_name):
         """Get the appropriate config directory for this application based on platform standards.
@@ -21,18 +66,23 @@ class ConfigManager:
         Returns:
             Path: Directory where configuration files should be stored
         """
+        return cls._compute_app_config_dir(app_name)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compute_app_config_dir(app_name):
+        """Resolve and create the config directory for an application once."""
         # Use platform-specific locations - removed OS-specific subdirectory
-        if platform.system() == "Windows":
-            base_dir = os.environ.get("LOCALAPPDATA", 
-                         os.path.join(os.environ["USERPROFILE"], "AppData", "Local"))
-            config_dir = Path(base_dir) / app_name / "Config"
-        elif platform.system() == "Darwin":  # macOS
-            config_dir = Path.home() / "Library" / "Application Support" / app_name / "Config"
+        # Build each path in one Path() call rather than a chain of joins
+        if _IS_WINDOWS:
+            config_dir = Path(_LOCALAPPDATA, app_name, "Config")
+        elif _IS_DARWIN:  # macOS
+            config_dir = Path(_HOME, "Library", "Application Support", app_name, "Config")
         else:  # Linux and other Unix-like
-            config_dir = Path.home() / ".config" / app_name
+            config_dir = Path(_HOME, ".config", app_name)
         
         # Create directory if it doesn't exist
-        config_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(config_dir, exist_ok=True)
         return config_dir
     
     @classmethod
@@ -48,61 +98,146 @@ class ConfigManager:
         Returns:
             Path: Path to the config directory that was used
         """
-        if not getattr(sys, 'frozen', False):
+        if not _IS_FROZEN:
             # Only needed in frozen applications
             return None
         
-        # Get appropriate config directory
+        # Get appropriate config directory, which get_app_config_dir creates
         if config_dir is None:
             config_dir = cls.get_app_config_dir(app_name)
         else:
             config_dir = Path(config_dir)
+            os.makedirs(config_dir, exist_ok=True)
         
-        # Ensure directory exists
-        os.makedirs(config_dir, exist_ok=True)
+        # Skip the directory scans when this build's configs were already extracted
+        marker_path = config_dir / _EXTRACTED_MARKER
+        build_id = _build_id()
+        try:
+            if marker_path.read_text(encoding="utf-8") == build_id:
+                return config_dir
+        except OSError:
+            pass
         
         # Source directory in PyInstaller bundle
-        meipass = Path(sys._MEIPASS)
-        source_ini_dir = meipass / "ares" / "ini"
+        source_ini_dir = _EMBEDDED_INI_DIR
         
         # Check if source directory exists
         if not source_ini_dir.exists():
-            print(f"Warning: No embedded config files found at {source_ini_dir}")
+            log.warning("No embedded config files found at %s", source_ini_dir)
             return config_dir
         
         # Only extract default config files that don't already exist
         # This ensures we don't overwrite user modified settings
-        for ini_file in source_ini_dir.glob("*.ini"):
-            target_path = config_dir / ini_file.name
-            
-            # Only copy if target doesn't exist to preserve user modifications
-            if not target_path.exists():
-                try:
-                    shutil.copy2(ini_file, target_path)
-                    print(f"Extracted config file: {ini_file.name} -> {target_path}")
-                except Exception as e:
-                    print(f"Error extracting config file {ini_file.name}: {e}")
+        with os.scandir(config_dir) as entries:
+            existing = frozenset(entry.name for entry in entries)
+        with os.scandir(source_ini_dir) as entries:
+            to_copy = [
+                entry for entry in entries
+                if entry.name.endswith(".ini") and entry.name not in existing
+                and entry.is_file(follow_symlinks=False)
+            ]
+        
+        def extract(entry):
+            target_path = config_dir / entry.name
+            try:
+                cls._copy_small_file(entry.path, target_path)
+                log.debug("Extracted config file: %s -> %s", entry.name, target_path)
+                return target_path
+            except Exception as e:
+                log.error("Error extracting config file %s: %s", entry.name, e)
+                return None
+                
+        # Overlap the copies' I/O; there are only a handful of small files
+        copied = []
+        if to_copy:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                copied = list(executor.map(extract, to_copy))
+        extracted = None not in copied
+        
+        # The listing and the copies show which config files now exist, so
+        # get_config_file_path does not have to check them one by one
+        _ensured_config_paths.update(config_dir / name for name in existing if name.endswith(".ini"))
+        _ensured_config_paths.update(path for path in copied if path is not None)
+                
+        # Only mark the build as extracted once every file is in place
+        if extracted:
+            try:
+                marker_path.write_text(build_id, encoding="utf-8")
+            except OSError as e:
+                log.debug("Could not write extraction marker %s: %s", marker_path, e)
         
         return config_dir
 
+    @staticmethod
+    def _copy_small_file(src, dst):
+        """Copy a small file without the metadata syscalls of shutil.copy2.
+        
+        Args:
+            src: Source file path
+            dst: Destination file path, which must not already exist
+        """
+        if _IS_WINDOWS:
+            # shutil.copy2 copies through the kernel's CopyFile2 on Windows
+            import shutil
+            if os.path.exists(dst):
+                raise FileExistsError(dst)
+            shutil.copy2(src, dst)
+            return
+            
+        src_fd = os.open(src, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                size = os.fstat(src_fd).st_size
+                if _IS_LINUX:
+                    # Copy inside the kernel where supported
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                else:
+                    os.write(dst_fd, os.read(src_fd, size))
+            except BaseException:
+                # An empty or partial copy would be kept as the user's config
+                # and never extracted again, so remove it
+                os.close(dst_fd)
+                os.unlink(dst)
+                raise
+            os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
     @classmethod
     def get_config_file_path(cls, filename, app_name, create_default=False):
         """Get the path to a config file, extracting from embedded resources if needed.
         
         Changed default behavior to not auto-create default files unless specifically requested.
         """
+        global _embedded_manifest
+        
         config_dir = cls.get_app_config_dir(app_name)
         config_path = config_dir / filename
         
-        # If the file doesn't exist and we should create defaults
-        if not config_path.exists() and create_default and getattr(sys, 'frozen', False):
-            # Get embedded file path using Paths utility
-            from ares.utils.paths import Paths
-            embedded_file = Paths.get_embedded_ini_file(filename)
-            if embedded_file.exists():
-                from ares.utils import BuildUtils
-                BuildUtils.copy_file_with_logging(embedded_file, config_path)
-        
+        # Only frozen apps asked to create defaults need to touch the filesystem
+        if not create_default or not _IS_FROZEN or config_path in _ensured_config_paths:
+            return config_path
+            
+        # If the file doesn't exist, extract the embedded default
+        if not config_path.exists():
+            if _embedded_manifest is None:
+                ini_dir = _EMBEDDED_INI_DIR
+                _embedded_manifest = frozenset(os.listdir(ini_dir)) if ini_dir.is_dir() else frozenset()
+                
+            if filename not in _embedded_manifest:
+                return config_path
+                
+            from ares.utils import BuildUtils
+            if not BuildUtils.copy_file_with_logging(_EMBEDDED_INI_DIR / filename, config_path):
+                return config_path
+                
+        _ensured_config_paths.add(config_path)
         return config_path
 
     @classmethod
@@ -113,14 +248,14 @@ class ConfigManager:
         It extracts embedded config files and sets up the config paths.
         """
         # Extract configs from embedded resources if in frozen app
-        if getattr(sys, 'frozen', False):
+        if _IS_FROZEN:
             config_dir = cls.extract_embedded_configs(app_name)
-            print(f"Application config directory: {config_dir}")
+            log.info("Application config directory: %s", config_dir)
             return config_dir
         
         # For development mode, just use the appropriate directory
         config_dir = cls.get_app_config_dir(app_name)
-        print(f"Using development config directory: {config_dir}")
+        log.info("Using development config directory: %s", config_dir)
         return config_dir
 
     @classmethod
@@ -130,6 +265,9 @@ class ConfigManager:
         Returns:
             dict: Dictionary mapping config names to their respective objects
         """
+        if cls._cached_objects is not None:
+            return cls._cached_objects
+            
         from ares.config import initialize
         from ares.config import engine_config, build_config, project_config, package_config, compiler_config, assets_config, logging_config
         
@@ -137,7 +275,7 @@ class ConfigManager:
         initialize()
         
         # Map of config objects by name
-        return {
+        cls._cached_objects = {
             ConfigType.ENGINE.value: engine_config,
             ConfigType.BUILD.value: build_config,
             ConfigType.PROJECT.value: project_config,
@@ -146,14 +284,16 @@ class ConfigManager:
             ConfigType.ASSETS.value: assets_config,
             ConfigType.LOGGING.value: logging_config
         }
+        return cls._cached_objects
 
     @classmethod
-    def load_config(cls, config_type, project_path):
+    def load_config(cls, config_type, project_path, config_ini=None):
         """Load a specific configuration type with project-specific overrides.
         
         Args:
             config_type: ConfigType enum value specifying which config to load
             project_path: Path to the project directory containing override INI files
+            config_ini: Optional precomputed path of the override INI file
             
         Returns:
             object: The loaded configuration object with any overrides applied
@@ -166,9 +306,25 @@ class ConfigManager:
         if not isinstance(config_type, ConfigType):
             raise TypeError(f"config_type must be a ConfigType enum, got {type(config_type).__name__}")
             
-        # Get all config objects
-        config_objects = cls.get_config_objects()
+        if config_ini is None:
+            config_ini = Path(project_path) / f"{config_type.value}.ini"
+        else:
+            config_ini = Path(config_ini)
+            
+        if not config_ini.exists():
+            config_ini = None
+            
+        return cls._load_one(config_type, config_ini, cls.get_config_objects())
+    
+    @classmethod
+    def _load_one(cls, config_type, config_ini, config_objects):
+        """Apply project overrides to one config object from a prebuilt objects dict.
         
+        Args:
+            config_type: ConfigType enum value specifying which config to load
+            config_ini: Path of an existing override INI file, or None
+            config_objects: Result of get_config_objects()
+        """
         # Get the config type value for dictionary lookup
         config_type_value = config_type.value
         
@@ -181,13 +337,10 @@ class ConfigManager:
         config_obj = config_objects[config_type_value]
         
         # Apply project-specific overrides if they exist
-        project_path = Path(project_path)
-        config_ini = project_path / f"{config_type_value}.ini"
-        
-        if config_ini.exists():
+        if config_ini is not None:
             override_info = config_obj.load_overrides(config_ini)
             if override_info["overridden"]:
-                print(f"Applied {config_type} configuration overrides from {config_ini}")
+                log.info("Applied %s configuration overrides from %s", config_type, config_ini)
         
         return config_obj
     
@@ -201,9 +354,21 @@ class ConfigManager:
         Returns:
             dict: Dictionary mapping config types to their respective loaded objects
         """
+        project_path = Path(project_path)
+        
+        # List the project directory once instead of checking each INI file
+        try:
+            with os.scandir(project_path) as entries:
+                present = frozenset(entry.name for entry in entries)
+        except OSError:
+            present = frozenset()
+            
         configs = {}
+        config_objects = cls.get_config_objects()
         for config_type in ConfigType:
-            configs[config_type] = cls.load_config(config_type, project_path)
+            ini_name = f"{config_type.value}.ini"
+            config_ini = project_path / ini_name if ini_name in present else None
+            configs[config_type] = cls._load_one(config_type, config_ini, config_objects)
             
         # Automatically set loaded configs as global configs
         from ares.config import set_global_configs
@@ -2,122 +2,149 @@
 Engine configuration settings for the Ares Engine project.
 """
 
+from types import MappingProxyType
+
 from .base_config import BaseConfig
 
+_ENGINE_DEFAULTS = MappingProxyType({
+    "graphics": MappingProxyType({
+        "resolution_width": 1280,
+        "resolution_height": 720,
+        "fullscreen": False,
+        "vsync": True,
+        "max_fps": 60,
+        "texture_quality": "high",
+        "shadows": True,
+        "shadow_quality": "medium",
+        "anti_aliasing": True,
+        "anti_aliasing_level": 4,
+        "anisotropic_filtering": 4,
+        "post_processing": True,
+    }),
+    "audio": MappingProxyType({
+        "master_volume": 0.8,
+        "music_volume": 0.7,
+        "sfx_volume": 1.0,
+        "voice_volume": 0.9,
+        "mute": False,
+        "audio_device": "default",
+        "audio_channels": 32,
+        "spatial_audio": True,
+        "sample_rate": 48000,
+    }),
+    "input": MappingProxyType({
+        "mouse_sensitivity": 1.0,
+        "invert_y": False,
+        "controller_enabled": True,
+        "controller_vibration": True,
+        "controller_deadzone": 0.1,
+        "key_mapping": "default",
+    }),
+    "physics": MappingProxyType({
+        "timestep": 0.016,
+        "gravity": 9.81,
+        "simulation_quality": "medium",
+        "max_objects": 1000,
+        "collision_precision": "medium",
+        "use_multithreaded_physics": True,
+    }),
+    "debug": MappingProxyType({
+        "logging_level": "info",
+        "show_fps": False,
+        "show_debug_info": False,
+        "console_enabled": False,
+        "profiler_enabled": False,
+        "memory_tracking": False,
+    }),
+})
+
 class EngineConfig(BaseConfig):
 
+    __slots__ = ("_resolution",)
+    _DEFAULTS = _ENGINE_DEFAULTS
+
     def __init__(self):
         super().__init__("engine")
-        self._create_default_config()
-        
-    def _create_default_config(self):
-        """Create default engine configuration."""
-        # Graphics section
-        self.set("graphics", "resolution_width", "1280")
-        self.set("graphics", "resolution_height", "720")
-        self.set("graphics", "fullscreen", "False")
-        self.set("graphics", "vsync", "True")
-        self.set("graphics", "max_fps", "60")
-        self.set("graphics", "texture_quality", "high")
-        self.set("graphics", "shadows", "True")
-        self.set("graphics", "shadow_quality", "medium")
-        self.set("graphics", "anti_aliasing", "True")
-        self.set("graphics", "anti_aliasing_level", "4")
-        self.set("graphics", "anisotropic_filtering", "4")
-        self.set("graphics", "post_processing", "True")
-        
-        # Audio section
-        self.set("audio", "master_volume", "0.8")
-        self.set("audio", "music_volume", "0.7")
-        self.set("audio", "sfx_volume", "1.0")
-        self.set("audio", "voice_volume", "0.9")
-        self.set("audio", "mute", "False")
-        self.set("audio", "audio_device", "default")
-        self.set("audio", "audio_channels", "32")
-        self.set("audio", "spatial_audio", "True")
-        self.set("audio", "sample_rate", "48000")
         
-        # Input section
-        self.set("input", "mouse_sensitivity", "1.0")
-        self.set("input", "invert_y", "False")
-        self.set("input", "controller_enabled", "True")
-        self.set("input", "controller_vibration", "True")
-        self.set("input", "controller_deadzone", "0.1")
-        self.set("input", "key_mapping", "default")
+    def _refresh_derived_values(self, section=None):
+        """Rebuild the resolution tuple when the graphics values change."""
+        super()._refresh_derived_values(section)
+        if section in (None, "graphics"):
+            self._resolution = (
+                self.get_int("resolution_width", 1280, "graphics"),
+                self.get_int("resolution_height", 720, "graphics"),
+            )
         
-        # Physics section
-        self.set("physics", "timestep", "0.016")
-        self.set("physics", "gravity", "9.81")
-        self.set("physics", "simulation_quality", "medium")
-        self.set("physics", "max_objects", "1000")
-        self.set("physics", "collision_precision", "medium")
-        self.set("physics", "use_multithreaded_physics", "True")
-        
-        # Debug section
-        self.set("debug", "logging_level", "info")
-        self.set("debug", "show_fps", "False")
-        self.set("debug", "show_debug_info", "False")
-        self.set("debug", "console_enabled", "False")
-        self.set("debug", "profiler_enabled", "False")
-        self.set("debug", "memory_tracking", "False")
-    
     def get_resolution(self):
         """Get the configured resolution as a tuple (width, height)."""
-        width = self.get_int("graphics", "resolution_width", 1280)
-        height = self.get_int("graphics", "resolution_height", 720)
-        return (width, height)
+        return self._resolution
+    
+    def set_resolution(self, width, height):
+        """Set the resolution used by the engine window."""
+        self.set("resolution_width", width, "graphics")
+        self.set("resolution_height", height, "graphics")
     
     def is_fullscreen(self):
         """Check if fullscreen mode is enabled."""
-        return self.get_bool("graphics", "fullscreen", False)
+        return self.get_bool("fullscreen", False, "graphics")
+    
+    def set_fullscreen(self, fullscreen):
+        """Enable or disable fullscreen mode."""
+        self.set("fullscreen", bool(fullscreen), "graphics")
     
     def is_vsync_enabled(self):
         """Check if vertical sync is enabled."""
-        return self.get_bool("graphics", "vsync", True)
+        return self.get_bool("vsync", True, "graphics")
     
     def get_max_fps(self):
         """Get the maximum frames per second setting."""
-        return self.get_int("graphics", "max_fps", 60)
+        return self.get_int("max_fps", 60, "graphics")
     
     def get_physics_timestep(self):
         """Get the physics engine timestep in seconds."""
-        return self.getfloat("physics", "timestep", 0.016)
+        return self.get_float("timestep", 0.016, "physics")
     
     def get_gravity(self):
         """Get the gravitational acceleration value."""
-        return self.getfloat("physics", "gravity", 9.81)
+        return self.get_float("gravity", 9.81, "physics")
     
     def get_logging_level(self):
         """Get the configured logging level."""
-        return self.get("debug", "logging_level", "info")
+        return self.get("logging_level", "info", "debug")
     
     def should_show_fps(self):
         """Check if FPS display is enabled."""
-        return self.get_bool("debug", "show_fps", False)
+        return self.get_bool("show_fps", False, "debug")
     
     def get_master_volume(self):
         """Get the master volume level."""
-        return self.getfloat("audio", "master_volume", 0.8)
+        return self.get_float("master_volume", 0.8, "audio")
+    
+    def set_master_volume(self, volume):
+        """Set the master volume level, clamped to the 0.0-1.0 range."""
+        self.set("master_volume", min(max(float(volume), 0.0), 1.0), "audio")
     
     def is_audio_muted(self):
         """Check if audio is muted."""
-        return self.get_bool("audio", "mute", False)
+        return self.get_bool("mute", False, "audio")
     
     def get_override_dict(self):
         """Get dictionary of important configuration values."""
-        resolution = self.get_resolution()
-        return {
-            "resolution": f"{resolution[0]}x{resolution[1]}",
-            "fullscreen": self.is_fullscreen(),
-            "vsync": self.is_vsync_enabled(),
-            "max_fps": self.get_max_fps(),
-            "physics_timestep": self.get_physics_timestep(),
-            "gravity": self.get_gravity(),
-            "logging_level": self.get_logging_level(),
-            "show_fps": self.should_show_fps(),
-            "master_volume": self.get_master_volume(),
-            "muted": self.is_audio_muted()
-        }
+        if self._override_dict is None:
+            resolution = self.get_resolution()
+            self._override_dict = {
+                "resolution": f"{resolution[0]}x{resolution[1]}",
+                "fullscreen": self.is_fullscreen(),
+                "vsync": self.is_vsync_enabled(),
+                "max_fps": self.get_max_fps(),
+                "physics_timestep": self.get_physics_timestep(),
+                "gravity": self.get_gravity(),
+                "logging_level": self.get_logging_level(),
+                "show_fps": self.should_show_fps(),
+                "master_volume": self.get_master_volume(),
+                "muted": self.is_audio_muted()
+            }
+        return self._copy_override_dict()
     
     def initialize(self, *args, **kwargs):
         """Initialize this configuration."""
@@ -3,20 +3,27 @@
 import os
 import sys
 import logging
-import logging.handlers
+import threading
 from pathlib import Path
 
 from .base_config import BaseConfig
-from ares.utils.paths import Paths
 
 class LoggingConfig(BaseConfig):
     """Configuration class for managing logging settings."""
     
+    __slots__ = ("logger", "initialized")
+    
+    # Serializes first-time setup so concurrent callers cannot add handlers twice
+    _init_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the logging configuration."""
-        super().__init__("logging")
+        if getattr(self, "_initialized", False):
+            return
+            
         self.logger = None
         self.initialized = False
+        super().__init__("logging")
         
     def initialize(self, logs_dir=None, log_filename="engine.log"):
         """Initialize the logging system with the configured settings.
@@ -31,9 +38,16 @@ class LoggingConfig(BaseConfig):
         if self.initialized:
             return True
             
-        # Load configuration if not already loaded
-        if not self.loaded:
-            self.load()
+        with self._init_lock:
+            if self.initialized:
+                return True
+            return self._setup_handlers(logs_dir, log_filename)
+            
+    def _setup_handlers(self, logs_dir, log_filename):
+        """Install the root logger handlers; called once under _init_lock."""
+        # Only runs that actually set up logging pay for these imports
+        import logging.handlers
+        from ares.utils.paths import Paths
         
         # Ensure logs directory exists
         if logs_dir is None:
@@ -56,9 +70,12 @@ class LoggingConfig(BaseConfig):
         logger = logging.getLogger()
         logger.setLevel(log_level)
         
-        # Clear any existing handlers
+        # Clear any existing handlers, closing file handlers so their
+        # descriptors are not left open once they are detached
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
         
         # Set up file handler with rotation
         log_file = logs_dir / log_filename
@@ -102,3 +119,14 @@ class LoggingConfig(BaseConfig):
             logging.Logger: Configured logger or None if not initialized
         """
         return self.logger
+
+def get_logging_config():
+    """Get the global logging configuration instance."""
+    return LoggingConfig()
+
+def __getattr__(name):
+    """Create the global logging config instance the first time it is accessed."""
+    if name == "logging_config":
+        globals()["logging_config"] = get_logging_config()
+        return globals()["logging_config"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,27 +1,48 @@
 """Package configuration for Ares Engine."""
 
+import re
 import platform
+from types import MappingProxyType
 
 from .base_config import BaseConfig
 
+_PACKAGE_DEFAULTS = MappingProxyType({
+    "package": MappingProxyType({
+        "include_debug_files": False,
+        "create_installer": True,
+        "compression_level": 9,
+        "console": True,
+        "onefile": True,
+        "icon_file": "ares/assets/icons/app.ico",
+        "target_platform": "auto",
+        "splash_screen": "ares/assets/images/splash.png",
+        "add_version_info": True,
+        "version_file": False,
+        "extensions": ".py,.pyx,.ini,.txt",
+    }),
+})
+
+# Platform-specific package data section, e.g. "package_data.windows"
+_PLATFORM_PACKAGE_DATA = f"package_data.{platform.system().lower()}"
+
+# One file pattern per line, ignoring blank lines and ';' comments
+_PATTERN_LINE = re.compile(r"^[ \t]*([^;\s][^;\n]*?)[ \t]*(?:;.*)?$", re.M)
+
 class PackageConfig(BaseConfig):
     """Configuration class for package and distribution settings."""
     
+    __slots__ = ("_package_data",)
+    _DEFAULTS = _PACKAGE_DEFAULTS
+    
     def __init__(self):
         """Initialize the package configuration."""
         super().__init__("package", "package")
-        self.set("include_debug_files", "False")
-        self.set("create_installer", "True")
-        self.set("compression_level", "9")
-        self.set("console", "True")
-        self.set("onefile", "True")
-        self.set("icon_file", "ares/assets/icons/app.ico")
-        self.set("target_platform", "auto")
-        self.set("splash_screen", "ares/assets/images/splash.png")
-        self.set("add_version_info", "True")
-        self.set("version_file", "False")
-        self.set("extensions", ".py,.pyx,.ini,.txt")
-
+        
+    def _refresh_derived_values(self, section=None):
+        """Forget the parsed package data when any value changes."""
+        super()._refresh_derived_values(section)
+        self._package_data = None
+        
     def is_console_enabled(self):
         """Check if console output is enabled for executables.
         
@@ -96,52 +117,21 @@ class PackageConfig(BaseConfig):
         Returns:
             dict: Package metadata suitable for setuptools.setup()
         """
-        # Ensure configuration is loaded
-        if not self.loaded:
-            self.load()
+        if self._package_data is None:
+            package_data = {}
+            
+            # Platform-specific entries override the common ones
+            for section in ("package_data", _PLATFORM_PACKAGE_DATA):
+                for key, value in self.get_section(section).items():
+                    file_patterns = _PATTERN_LINE.findall(value)
+                    
+                    # Only add entry if there are patterns
+                    if file_patterns:
+                        package_data[key] = file_patterns
+                        
+            self._package_data = package_data
             
-        package_data = {}
-        
-        # Check if package_data section exists
-        if self.parser.has_section("package_data"):
-            # Process all package data entries
-            for key, value in self.parser.items("package_data"):
-                # Split the value by lines and strip comments
-                lines = value.strip().split('\n')
-                file_patterns = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith(';'):
-                        # Split at the first semicolon to remove trailing comments
-                        pattern = line.split(';', 1)[0].strip()
-                        if pattern:
-                            file_patterns.append(pattern)
-                
-                # Only add entry if there are patterns
-                if file_patterns:
-                    package_data[key] = file_patterns
-        
-        # Check for platform-specific overrides
-        platform_system = platform.system().lower()
-        platform_section = f"package_data.{platform_system}"
-        
-        if self.parser.has_section(platform_section):
-            # Apply platform-specific overrides
-            for key, value in self.parser.items(platform_section):
-                # Process value the same way as above
-                lines = value.strip().split('\n')
-                file_patterns = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith(';'):
-                        pattern = line.split(';', 1)[0].strip()
-                        if pattern:
-                            file_patterns.append(pattern)
-                
-                if file_patterns:
-                    package_data[key] = file_patterns
-                
-        return package_data
+        return {key: list(patterns) for key, patterns in self._package_data.items()}
         
     def get_override_dict(self):
         """Get a dictionary of overridable package configuration.
@@ -151,13 +141,15 @@ class PackageConfig(BaseConfig):
         Returns:
             dict: Dictionary of configuration values that affect builds
         """
-        return {
-            "console": self.is_console_enabled(),
-            "onefile": self.is_onefile_enabled(),
-            "compression_level": self.get_compression_level(),
-            "include_debug_files": self.should_include_debug_files(),
-            "create_installer": self.should_create_installer()
-        }
+        if self._override_dict is None:
+            self._override_dict = {
+                "console": self.is_console_enabled(),
+                "onefile": self.is_onefile_enabled(),
+                "compression_level": self.get_compression_level(),
+                "include_debug_files": self.should_include_debug_files(),
+                "create_installer": self.should_create_installer()
+            }
+        return self._copy_override_dict()
     
     def initialize(self, *args, **kwargs):
         """Initialize this configuration."""
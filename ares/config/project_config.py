@@ -2,28 +2,43 @@
 Project configuration settings for the Ares Engine project.
 """
 
+from types import MappingProxyType
+
 from .base_config import BaseConfig
 
+_PROJECT_DEFAULTS = MappingProxyType({
+    "project": MappingProxyType({
+        "company_name": "Ares Engine",
+        "product_name": "Ares",
+        "file_description": "Game built with Ares Engine",
+    }),
+    "version": MappingProxyType({
+        "major": 0,
+        "minor": 1,
+        "patch": 0,
+        "release_type": "alpha",
+        "build": "auto",
+    }),
+})
+
 
 class ProjectConfig(BaseConfig):
 
+    __slots__ = ("_version_string",)
+    _DEFAULTS = _PROJECT_DEFAULTS
+
     def __init__(self):
         super().__init__("project")
-        self._create_default_config()
-
-    def _create_default_config(self):
-        """Create default project configuration."""
-        # Project section
-        self.set("project", "company_name", "Ares Engine")
-        self.set("project", "product_name", "Ares")
-        self.set("project", "file_description", "Game built with Ares Engine")
-
-        # Version section
-        self.set("version", "major", "0")
-        self.set("version", "minor", "1")
-        self.set("version", "patch", "0")
-        self.set("version", "release_type", "alpha")
-        self.set("version", "build", "auto")
+
+    def _refresh_derived_values(self, section=None):
+        """Rebuild the version string when the version values change."""
+        super()._refresh_derived_values(section)
+        if section in (None, "version"):
+            major = self.get_int("major", 0, "version")
+            minor = self.get_int("minor", 1, "version")
+            patch = self.get_int("patch", 0, "version")
+            release = self.get("release_type", "alpha", "version")
+            self._version_string = f"{major}.{minor}.{patch}-{release}"
 
     def get_build_config_file(self):
         """Get the path to the build configuration file."""
@@ -47,21 +62,30 @@ class ProjectConfig(BaseConfig):
 
     def get_version_string(self):
         """Get full version string."""
-        major = self.get_int("version", "major", 0)
-        minor = self.get_int("version", "minor", 1)
-        patch = self.get_int("version", "patch", 0)
-        release = self.get("version", "release_type", "alpha")
-        return f"{major}.{minor}.{patch}-{release}"
+        return self._version_string
 
     def get_override_dict(self):
         """Get dictionary of important configuration values."""
-        return {
-            "company_name": self.get_company_name(),
-            "product_name": self.get_product_name(),
-            "file_description": self.get_file_description(),
-            "version_string": self.get_version_string()
-        }
+        if self._override_dict is None:
+            self._override_dict = {
+                "company_name": self.get_company_name(),
+                "product_name": self.get_product_name(),
+                "file_description": self.get_file_description(),
+                "version_string": self.get_version_string()
+            }
+        return self._copy_override_dict()
 
     def initialize(self, *args, **kwargs):
         """Initialize this configuration."""
         return True
+
+def get_project_config():
+    """Get the global project configuration instance."""
+    return ProjectConfig()
+
+def __getattr__(name):
+    """Create the global project config instance the first time it is accessed."""
+    if name == "project_config":
+        globals()["project_config"] = get_project_config()
+        return globals()["project_config"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,41 @@
 """
 Input handling system for keyboard, mouse, and gamepads.
 """
+import ctypes
+from operator import itemgetter
+from types import MappingProxyType
 import sdl2
 
+# Number of events taken from the SDL queue per SDL_PeepEvents call
+_EVENT_BATCH_SIZE = 128
+
 class Input:
+    
+    __slots__ = (
+        "_events", "keyboard_state", "mouse_x", "mouse_y", "_mouse_x", "_mouse_y", "_mouse_button_state",
+        "actions", "_key_mappings", "_key_to_action", "key_just_pressed", "_dispatch",
+        "_action_names", "_gather_scancodes",
+    )
+    
+    # Masks indexed the same way as the mouse_buttons list (left, middle, right)
+    _MASKS = (sdl2.SDL_BUTTON_LMASK, sdl2.SDL_BUTTON_MMASK, sdl2.SDL_BUTTON_RMASK)
+    
     def __init__(self):
-        self.event = sdl2.SDL_Event()
+        # Preallocated buffer the event queue is drained into
+        self._events = (sdl2.SDL_Event * _EVENT_BATCH_SIZE)()
+        
+        # SDL keeps this array valid for the program's lifetime and updates it
+        # in place whenever events are pumped, so it is fetched only once
         self.keyboard_state = sdl2.SDL_GetKeyboardState(None)
         self.mouse_x = 0
         self.mouse_y = 0
-        self.mouse_buttons = [False, False, False]
+        
+        # Mouse position out-parameters reused by SDL_GetMouseState every frame
+        self._mouse_x = sdl2.c_int(0)
+        self._mouse_y = sdl2.c_int(0)
+        
+        # Button bitmask as returned by SDL_GetMouseState
+        self._mouse_button_state = 0
         
         # Add action mapping (similar to Mars X)
         self.actions = {
@@ -23,8 +49,8 @@ class Input:
             'quit': False
         }
         
-        # Key mappings for game actions
-        self.key_mappings = {
+        # Key mappings for game actions, changed through set_key_mapping()
+        self._key_mappings = {
             'move_forward': sdl2.SDLK_w,
             'move_backward': sdl2.SDLK_s,
             'move_left': sdl2.SDLK_a,
@@ -35,8 +61,45 @@ class Input:
             'quit': sdl2.SDLK_ESCAPE
         }
         
-        # Track one-time actions
-        self.key_just_pressed = {action: False for action in self.actions}
+        self._rebuild_key_tables()
+        
+        # Actions pressed since the last process_events call
+        self.key_just_pressed = set()
+        
+        # Handler for each SDL event type that affects input state
+        self._dispatch = {
+            sdl2.SDL_KEYDOWN: self._on_key_down,
+            sdl2.SDL_KEYUP: self._on_key_up,
+            sdl2.SDL_QUIT: self._on_quit,
+            sdl2.SDL_KEYMAPCHANGED: self._on_keymap_changed,
+        }
+        
+    @property
+    def key_mappings(self):
+        """Read-only view of the action to key mappings."""
+        return MappingProxyType(self._key_mappings)
+        
+    def set_key_mapping(self, action, key):
+        """Bind an action to a key, replacing its previous binding.
+        
+        Args:
+            action: Name of the game action
+            key: SDL keycode (SDLK_*) that triggers the action
+        """
+        self._key_mappings[action] = key
+        
+        # The action's old key may still be held, so it starts out released
+        self.actions[action] = False
+        self._rebuild_key_tables()
+        
+    def _rebuild_key_tables(self):
+        """Rebuild the lookup tables derived from the key mappings."""
+        # Reverse of the key mappings so key events find their action with one lookup
+        self._key_to_action = {key: action for action, key in self._key_mappings.items()}
+        
+        # Mapped actions, in the order of the scancode gather built by get_held_actions()
+        self._action_names = tuple(self._key_mappings)
+        self._gather_scancodes = None
         
     def process_events(self):
         """Process all pending SDL events and update input state.
@@ -44,72 +107,55 @@ class Input:
         Returns:
             bool: True if the application should continue, False if quit was requested.
         """
-        quit_requested = False
-        
         # Reset one-time actions
-        for action in self.key_just_pressed:
-            self.key_just_pressed[action] = False
-        
-        # Poll all events
-        while sdl2.SDL_PollEvent(self.event):
-            # Handle mouse motion
-            if self.event.type == sdl2.SDL_MOUSEMOTION:
-                self.mouse_x = self.event.motion.x
-                self.mouse_y = self.event.motion.y
-            
-            # Handle mouse buttons
-            elif self.event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                if self.event.button.button == sdl2.SDL_BUTTON_LEFT:
-                    self.mouse_buttons[0] = True
-                elif self.event.button.button == sdl2.SDL_BUTTON_MIDDLE:
-                    self.mouse_buttons[1] = True
-                elif self.event.button.button == sdl2.SDL_BUTTON_RIGHT:
-                    self.mouse_buttons[2] = True
-                    
-            elif self.event.type == sdl2.SDL_MOUSEBUTTONUP:
-                if self.event.button.button == sdl2.SDL_BUTTON_LEFT:
-                    self.mouse_buttons[0] = False
-                elif self.event.button.button == sdl2.SDL_BUTTON_MIDDLE:
-                    self.mouse_buttons[1] = False
-                elif self.event.button.button == sdl2.SDL_BUTTON_RIGHT:
-                    self.mouse_buttons[2] = False
-            
-            # Handle key events
-            elif self.event.type == sdl2.SDL_KEYDOWN:
-                key = self.event.key.keysym.sym
-                
-                # Update action states based on key mappings
-                for action, mapped_key in self.key_mappings.items():
-                    if key == mapped_key:
-                        self.actions[action] = True
-                        self.key_just_pressed[action] = True
-                        
-                        # Handle special case for fullscreen toggle
-                        if action == 'toggle_fullscreen' and self.key_just_pressed[action]:
-                            # The window will need to handle this separately
-                            pass
-                
-            elif self.event.type == sdl2.SDL_KEYUP:
-                key = self.event.key.keysym.sym
+        self.key_just_pressed.clear()
+        
+        # Drain the event queue in batches rather than one SDL_PollEvent
+        # call per event, with the loop's lookups bound to locals
+        events = self._events
+        dispatch = self._dispatch
+        peep = sdl2.SDL_PeepEvents
+        sdl2.SDL_PumpEvents()
+        while True:
+            count = peep(events, _EVENT_BATCH_SIZE, sdl2.SDL_GETEVENT,
+                         sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+            for index in range(count):
+                event = events[index]
+                handler = dispatch.get(event.type)
+                if handler is not None:
+                    handler(event)
+            if count < _EVENT_BATCH_SIZE:
+                break
                 
-                # Update action states based on key mappings
-                for action, mapped_key in self.key_mappings.items():
-                    if key == mapped_key:
-                        self.actions[action] = False
-                        
-            # Handle quit event (window close)
-            elif self.event.type == sdl2.SDL_QUIT:
-                self.actions['quit'] = True
-                quit_requested = True
-        
-        # Update keyboard state
-        self.keyboard_state = sdl2.SDL_GetKeyboardState(None)
+        # Read the mouse once per frame instead of handling each motion and
+        # button event
+        self._mouse_button_state = sdl2.SDL_GetMouseState(self._mouse_x, self._mouse_y)
+        self.mouse_x = self._mouse_x.value
+        self.mouse_y = self._mouse_y.value
         
-        # Check if quit action was triggered
-        if self.actions['quit']:
-            quit_requested = True
+        # Return True to continue, False if quit was requested
+        return not self.actions['quit']
+    
+    def _on_key_down(self, event):
+        """Activate the key's action; toggle_fullscreen is handled by the window."""
+        action = self._key_to_action.get(event.key.keysym.sym)
+        if action is not None:
+            self.actions[action] = True
+            self.key_just_pressed.add(action)
+            
+    def _on_key_up(self, event):
+        """Deactivate the key's action."""
+        action = self._key_to_action.get(event.key.keysym.sym)
+        if action is not None:
+            self.actions[action] = False
             
-        return not quit_requested  # Return True to continue, False to quit
+    def _on_quit(self, event):
+        """Request quit when the window is closed."""
+        self.actions['quit'] = True
+        
+    def _on_keymap_changed(self, event):
+        """Drop the scancode gather; the keyboard layout maps keys differently now."""
+        self._gather_scancodes = None
         
     def update(self):
         """Legacy method for compatibility. Use process_events() instead."""
@@ -119,13 +165,35 @@ class Input:
         """Check if a key is currently pressed."""
         return bool(self.keyboard_state[key])
         
+    def get_held_actions(self):
+        """Get the set of actions whose mapped keys are currently held.
+        
+        Copies the keyboard state once and gathers every mapped scancode from
+        the copy, instead of indexing the SDL array once per action.
+        """
+        # Scancodes are resolved on first use rather than in __init__, which
+        # may run before video is initialized, and again after layout changes
+        gather = self._gather_scancodes
+        if gather is None:
+            scancodes = [sdl2.SDL_GetScancodeFromKey(key) for key in self._key_mappings.values()]
+            gather = self._gather_scancodes = itemgetter(*scancodes)
+            
+        state = ctypes.string_at(self.keyboard_state, sdl2.SDL_NUM_SCANCODES)
+        held = gather(state)
+        return {action for action, pressed in zip(self._action_names, held) if pressed}
+        
     def get_mouse_position(self):
         """Get the current mouse position."""
         return (self.mouse_x, self.mouse_y)
         
+    @property
+    def mouse_buttons(self):
+        """Pressed state of the left, middle and right mouse buttons as a list."""
+        return [bool(self._mouse_button_state & mask) for mask in self._MASKS]
+        
     def is_mouse_button_pressed(self, button):
         """Check if a mouse button is currently pressed."""
-        return self.mouse_buttons[button]
+        return bool(self._mouse_button_state & self._MASKS[button])
         
     def is_action_active(self, action):
         """Check if a game action is currently active."""
@@ -133,4 +201,4 @@ class Input:
     
     def is_action_just_pressed(self, action):
         """Check if a game action was just pressed this frame."""
-        return self.key_just_pressed.get(action, False)
+        return action in self.key_just_pressed
@@ -1,8 +1,22 @@
 """Window management system using SDL2."""
 import logging
+from functools import lru_cache
 import sdl2
 import sdl2.ext
 
+# Frame rate throttle() caps the main loop at
+_TARGET_FPS = 120
+
+# Vulkan support of the installed SDL2 bindings, resolved once at import
+_VULKAN_FLAG = getattr(sdl2, 'SDL_WINDOW_VULKAN', 0)
+_VK_GET_EXTENSIONS = getattr(sdl2, 'SDL_Vulkan_GetInstanceExtensions', None)
+_VK_CREATE_SURFACE = getattr(sdl2, 'SDL_Vulkan_CreateSurface', None)
+
+@lru_cache(maxsize=32)
+def _color(r, g, b):
+    """Return a shared opaque Color; clears reuse the same few colors every frame."""
+    return sdl2.ext.Color(r, g, b, 255)
+
 class Window:
     """Window class for rendering graphics using SDL2."""
     
@@ -21,8 +35,7 @@ class Window:
         self.ext_window = sdl2.ext.Window(
             title,
             size=(width, height),
-            flags=sdl2.SDL_WINDOW_RESIZABLE | 
-                 (sdl2.SDL_WINDOW_VULKAN if hasattr(sdl2, 'SDL_WINDOW_VULKAN') else 0)
+            flags=sdl2.SDL_WINDOW_RESIZABLE | _VULKAN_FLAG
         )
         self.window = self.ext_window.window
         
@@ -34,6 +47,10 @@ class Window:
         
         # Set default background color to black
         self.renderer.color = sdl2.ext.Color(0, 0, 0, 255)
+        
+        # Frame budget and start of the current frame used by throttle()
+        self._target_frame_ms = 1000 // _TARGET_FPS
+        self._last_tick = sdl2.SDL_GetTicks()
     
     def get_sdl_window(self):
         """Get the underlying SDL window handle."""
@@ -70,28 +87,60 @@ class Window:
         """Legacy method that processes SDL events directly.
         
         This is maintained for backward compatibility. New code should use
-        an Input object to process events.
+        an Input object to process events, preferably through frame().
         
         Returns:
             bool: True if the application should continue, False if quit was requested.
         """
         event = sdl2.SDL_Event()
         while sdl2.SDL_PollEvent(event):
-            if event.type == sdl2.SDL_QUIT:
-                self.running = False
+            if not self._handle_event(event):
                 return False
-            elif event.type == sdl2.SDL_KEYDOWN:
-                if event.key.keysym.sym == sdl2.SDLK_F11:
-                    self.toggle_fullscreen()
-                elif event.key.keysym.sym == sdl2.SDLK_ESCAPE:
-                    self.running = False
-                    return False
-            elif event.type == sdl2.SDL_WINDOWEVENT:
-                if event.window.event == sdl2.SDL_WINDOWEVENT_RESIZED:
-                    self.width = event.window.data1
-                    self.height = event.window.data2
         
         return True
+        
+    def wait_events(self, timeout_ms=16):
+        """Variant of process_events for tool windows that sleeps while idle.
+        
+        Blocks for up to timeout_ms waiting for the first event instead of
+        returning straight away, then drains whatever else is queued.
+        
+        Args:
+            timeout_ms (int, optional): Longest time to wait for an event. Defaults to 16 (about 60Hz).
+            
+        Returns:
+            bool: True if the application should continue, False if quit was requested.
+        """
+        event = sdl2.SDL_Event()
+        if not sdl2.SDL_WaitEventTimeout(event, timeout_ms):
+            return True
+            
+        while self._handle_event(event):
+            if not sdl2.SDL_PollEvent(event):
+                return True
+                
+        return False
+        
+    def _handle_event(self, event):
+        """Apply a single event; returns False if it requests quitting."""
+        match event.type:
+            case sdl2.SDL_QUIT:
+                self.running = False
+                return False
+            case sdl2.SDL_KEYDOWN:
+                match event.key.keysym.sym:
+                    case sdl2.SDLK_F11:
+                        self.toggle_fullscreen()
+                    case sdl2.SDLK_ESCAPE:
+                        self.running = False
+                        return False
+            case sdl2.SDL_WINDOWEVENT:
+                window_event = event.window
+                if window_event.event == sdl2.SDL_WINDOWEVENT_RESIZED:
+                    self.width = window_event.data1
+                    self.height = window_event.data2
+                    
+        return True
     
     def handle_input(self, input_handler):
         """Process events using an Input handler.
@@ -112,14 +161,47 @@ class Window:
             
         return continue_running
     
+    def frame(self, input_handler, draw_fn):
+        """Run one frame: drain input, draw, then present once.
+        
+        This is the preferred way to drive the main loop. All pending events
+        are handled before anything is drawn, so the frame is presented once
+        rather than after each event.
+        
+        Args:
+            input_handler: An instance of Input from ares.core.input
+            draw_fn: Callable taking the window's renderer that draws the frame
+        
+        Returns:
+            bool: True if the application should continue, False if quit was requested.
+        """
+        if not self.handle_input(input_handler):
+            return False
+        
+        self.renderer.clear()
+        draw_fn(self.renderer)
+        self.renderer.present()
+        return True
+        
     def clear(self, r=0, g=0, b=0):
         """Clear the window to the specified color."""
-        self.renderer.color = sdl2.ext.Color(r, g, b)
+        self.renderer.color = _color(r, g, b)
         self.renderer.clear()
     
     def present(self):
         """Present the current frame to the screen."""
         self.renderer.present()
+        
+    def throttle(self):
+        """Sleep away what is left of the frame budget.
+        
+        Call once per frame after present() so the main loop does not spin
+        a core at 100% polling for events.
+        """
+        elapsed = sdl2.SDL_GetTicks() - self._last_tick
+        if elapsed < self._target_frame_ms:
+            sdl2.SDL_Delay(self._target_frame_ms - elapsed)
+        self._last_tick = sdl2.SDL_GetTicks()
     
     def close(self):
         """Close the window and clean up resources."""
@@ -135,15 +217,15 @@ class Window:
     # Additional Vulkan-related methods for future compatibility
     def get_vulkan_instance_extensions(self):
         """Get required Vulkan instance extensions for this window."""
-        if not hasattr(sdl2, 'SDL_Vulkan_GetInstanceExtensions'):
+        if _VK_GET_EXTENSIONS is None:
             return []
             
         try:
             extension_count = sdl2.c_uint32(0)
-            sdl2.SDL_Vulkan_GetInstanceExtensions(self.window, extension_count, None)
+            _VK_GET_EXTENSIONS(self.window, extension_count, None)
             
             extensions = (sdl2.c_char_p * extension_count.value)()
-            sdl2.SDL_Vulkan_GetInstanceExtensions(self.window, extension_count, extensions)
+            _VK_GET_EXTENSIONS(self.window, extension_count, extensions)
             
             return [extensions[i].decode() for i in range(extension_count.value)]
         except Exception as e:
@@ -152,12 +234,12 @@ class Window:
     
     def create_vulkan_surface(self, instance):
         """Create a Vulkan surface for this window."""
-        if not hasattr(sdl2, 'SDL_Vulkan_CreateSurface'):
+        if _VK_CREATE_SURFACE is None:
             return None
             
         try:
             surface = sdl2.vk.VkSurfaceKHR()
-            if not sdl2.SDL_Vulkan_CreateSurface(self.window, instance, surface):
+            if not _VK_CREATE_SURFACE(self.window, instance, surface):
                 raise RuntimeError(f"Failed to create Vulkan surface: {sdl2.SDL_GetError().decode()}")
             return surface
         except Exception as e:
@@ -9,6 +9,13 @@ from typing import Any, Dict
 from ares.utils.log import log
 from ares.utils.paths import Paths
 
+# orjson encodes and decodes large file hash maps much faster than json; the
+# cache file format is the same either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add this module-level function to allow direct import
 def _preprocess_paths_for_json(config: Dict[str, Any]) -> Dict[str, Any]:
     """Convert Path objects to strings for JSON serialization.
@@ -89,8 +96,9 @@ class BuildCache:
             return self.cache
         
         try:
-            with open(self.cache_file, 'r') as f:
-                self.cache = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                data = f.read()
+            self.cache = orjson.loads(data) if orjson else json.loads(data)
             self.dirty = False
         except (json.JSONDecodeError, OSError) as e:
             log.warn(f"Error loading build cache: {e}")
@@ -130,8 +138,12 @@ class BuildCache:
         self.cache["last_build"] = datetime.datetime.now().isoformat()
         
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            if orjson:
+                data = orjson.dumps(self.cache, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(self.cache, indent=2).encode()
+            with open(self.cache_file, 'wb') as f:
+                f.write(data)
             self.dirty = False
             return True
         except OSError as e:
@@ -210,9 +210,8 @@ class BuildUtils:
             cls._loading_config = True
             
             # Import here to avoid circular imports
-            from ares.config.project_config import ProjectConfig
-            project_config = ProjectConfig()
-            app_name = project_config.get_product_name()
+            from ares.config.project_config import get_project_config
+            app_name = get_project_config().get_product_name()
             
             # Reset flag
             cls._loading_config = False
@@ -399,9 +399,7 @@ setup(
                 return []
                 
             # Read the package.ini file
-            import configparser
-            parser = configparser.ConfigParser()
-            parser.read(package_ini_path)
+            parser = Paths.load_ini(package_ini_path)
             
             log.info(f"Extension loading: Loaded package.ini from {package_ini_path}")
             log.info(f"Extension loading: Available sections: {parser.sections()}")
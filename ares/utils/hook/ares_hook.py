@@ -2,6 +2,7 @@
 
 import os
 import sys
+import functools
 from pathlib import Path
 
 from ares.utils.const import (
@@ -11,6 +12,10 @@ from ares.utils.const import (
     PYTHON_EXT
 )
 
+# File suffixes bundled as binaries and as data, built once for endswith()
+_BINARY_SUFFIXES = (PYD_EXTENSION, SO_EXTENSION)
+_DATA_SUFFIXES = (PYTHON_EXT, '.ini')
+
 def get_ares_path():
     """Get the path to the ares package."""
     try:
@@ -20,40 +25,55 @@ def get_ares_path():
         print(f"Error: Could not import ares package: {e}")
         sys.exit(ERROR_MISSING_DEPENDENCY)
 
+@functools.lru_cache(maxsize=None)
 def collect_ares_files():
-    """Collect all Ares Engine files."""
+    """Collect all Ares Engine files, walking the package only once."""
     datas = []
     binaries = []
     
     # Get the ares package path
     ares_path = get_ares_path()
     
-    # Walk through the package
-    for root, _, files in os.walk(ares_path):
-        # Skip __pycache__ directories
-        if "__pycache__" in root:
-            continue
-            
-        for file in files:
-            # Skip __pycache__ files and .pyc files
-            if "__pycache__" in file or file.endswith('.pyc'):
-                continue
+    # Every walked directory starts with the parent's path, so its destination
+    # is what follows that prefix
+    prefix_len = len(os.path.join(str(ares_path.parent), ""))
+    
+    # Walk the package with scandir, whose entries already know their type
+    stack = [str(ares_path)]
+    while stack:
+        root = stack.pop()
+        dest_dir = root[prefix_len:]
+        
+        with os.scandir(root) as entries:
+            for entry in entries:
+                file = entry.name
                 
-            src_path = os.path.join(root, file)
-            dest_dir = os.path.relpath(root, ares_path.parent)
-            
-            if file.endswith((PYD_EXTENSION, SO_EXTENSION)):
-                binaries.append((src_path, dest_dir))
-            elif file.endswith((PYTHON_EXT, '.ini')):
-                datas.append((src_path, dest_dir))
+                # Skip __pycache__ directories and files, and .pyc files
+                if "__pycache__" in file:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if file.endswith('.pyc'):
+                    continue
+                    
+                if file.endswith(_BINARY_SUFFIXES):
+                    binaries.append((entry.path, dest_dir))
+                elif file.endswith(_DATA_SUFFIXES):
+                    datas.append((entry.path, dest_dir))
     
     return datas, binaries
 
-# Tell PyInstaller about our data files
-datas, binaries = collect_ares_files()
+def __getattr__(name):
+    """Collect the data files and binaries the first time PyInstaller asks for them."""
+    if name in ("datas", "binaries"):
+        datas, binaries = collect_ares_files()
+        globals().update(datas=datas, binaries=binaries)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Tell PyInstaller what hidden imports to include
-hiddenimports = [
+hiddenimports = (
     # SDL2 modules
     'sdl2.dll', 'sdl2.sdlttf', 'sdl2.sdlimage', 'sdl2.sdlmixer',
     
@@ -78,5 +98,5 @@ hiddenimports = [
     'ares.utils.hook.configs_hook',
     'ares.utils.hook.logging_hook',
     'ares.utils.hook.sdl2_hook',
-    'ares.utils.hook.cython_hook'
-]
+    'ares.utils.hook.cython_hook',
+)
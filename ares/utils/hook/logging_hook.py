@@ -1,5 +1,6 @@
 """Runtime logging hook - integrates with Ares Engine logging system in frozen applications"""
 
+import re
 import sys
 import logging
 import traceback
@@ -19,6 +20,10 @@ _original_stderr = sys.stderr
 # Track if we're initialized
 _hook_initialized = False
 
+# Keywords that upgrade a redirected line to an error or a warning
+_ERROR_KEYWORDS = re.compile(r"error:|exception:|failed", re.IGNORECASE)
+_WARNING_KEYWORDS = re.compile(r"warning:|warn", re.IGNORECASE)
+
 class LoggerWriter:
     '''Redirects stdout/stderr to logger'''
     def __init__(self, logger, level):
@@ -26,6 +31,14 @@ class LoggerWriter:
         self.level = level
         self.buffer = ""
         
+        # Bound once so each write skips the attribute lookups
+        self._log = logger.log
+        self._err = logger.error
+        self._warn = logger.warning
+        
+        # Formatted records of this writer's own errors, which must not be logged again
+        self._own_error_marker = f"- {logger.name} - ERROR -"
+        
     def write(self, message):
         # Write to original stdout/stderr
         if self.level == logging.ERROR:
@@ -33,22 +46,40 @@ class LoggerWriter:
         else:
             _original_stdout.write(message)
         
-        # Also log the message (only if it contains something)
+        # Also log the message, once per complete line since print() writes
+        # the text and its newline separately
+        if "\n" not in message:
+            self.buffer += message
+            return
+            
+        lines = (self.buffer + message).split("\n")
+        self.buffer = lines.pop()
+        for line in lines:
+            self._log_line(line)
+            
+    def _log_line(self, message):
+        # Only log lines that contain something
         message = message.strip()
         if message:
             # Look for warnings and errors and upgrade their log level
-            lower_message = message.lower()
-            if any(keyword in lower_message for keyword in ['error:', 'exception:', 'failed']):
-                self.logger.error(message)
-            elif any(keyword in lower_message for keyword in ['warning:', 'warn']):
-                self.logger.warning(message)
+            if _ERROR_KEYWORDS.search(message):
+                self._err(message)
+            elif _WARNING_KEYWORDS.search(message):
+                self._warn(message)
             # Avoid recursive logging loops by checking for certain patterns
-            elif self.level == logging.ERROR and "- root - ERROR -" in message:
+            elif self.level == logging.ERROR and (
+                "- root - ERROR -" in message or self._own_error_marker in message
+            ):
                 return
             else:
-                self.logger.log(self.level, message)
+                self._log(self.level, message)
             
     def flush(self):
+        # Log any partial line still waiting for its newline
+        if self.buffer:
+            self._log_line(self.buffer)
+            self.buffer = ""
+            
         # Need to implement flush for file compatibility
         if self.level == logging.ERROR:
             _original_stderr.flush()
@@ -155,9 +186,11 @@ def setup_runtime_logging():
     # Set up exception hook
     sys.excepthook = handle_exception
     
-    # Redirect stdout and stderr through our logger
-    sys.stdout = LoggerWriter(logging.getLogger(), logging.INFO)
-    sys.stderr = LoggerWriter(logging.getLogger(), logging.ERROR)
+    # Redirect stdout and stderr through our logger. These stay outside the
+    # "ares" logger tree, which does not propagate, so their records reach
+    # the root logger's file handler
+    sys.stdout = LoggerWriter(logging.getLogger("stdout"), logging.INFO)
+    sys.stderr = LoggerWriter(logging.getLogger("stderr"), logging.ERROR)
     
     _hook_initialized = True
 
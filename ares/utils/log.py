@@ -1,9 +1,7 @@
 """Central logging facility for Ares Engine with unified interface."""
 
 import datetime
-import inspect
 import logging
-import logging.config
 import os
 import sys
 from pathlib import Path
@@ -27,19 +25,31 @@ class ContextAwareLogger:
         self._level = logging.INFO
         self._file_handlers: Dict[str, logging.FileHandler] = {}
         self._default_log_dir = None
+        
+        # Loggers already resolved for each caller name, so repeat calls
+        # skip logging.getLogger and the module lock it takes
+        self._loggers: Dict[str, logging.Logger] = {}
     
     def _get_caller_info(self) -> str:
         """Determine the calling module and function name for context-aware logging."""
-        # Get the call stack
-        stack = inspect.stack()
-        # Skip this function and the logging function that called it
-        for frame in stack[2:]:
-            module = inspect.getmodule(frame[0])
-            if module and module.__name__ != __name__:
-                function = frame.function
-                return f"{module.__name__}.{function}"
+        # Walk the frames directly; inspect.stack() would also load source
+        # context for every frame on each log call
+        frame = sys._getframe(1)
+        while frame is not None:
+            module_name = frame.f_globals.get("__name__")
+            if module_name and module_name != __name__:
+                return f"{module_name}.{frame.f_code.co_name}"
+            frame = frame.f_back
         return "ares.unknown"
     
+    def _get_caller_logger(self) -> logging.Logger:
+        """Get the logger named after the calling module and function."""
+        caller = self._get_caller_info()
+        logger = self._loggers.get(caller)
+        if logger is None:
+            logger = self._loggers[caller] = logging.getLogger(caller)
+        return logger
+    
     def set_default_log_dir(self, log_dir: Union[str, Path]) -> None:
         """Set the default directory for log files."""
         if isinstance(log_dir, str):
@@ -111,20 +121,17 @@ class ContextAwareLogger:
         
     def debug(self, msg: Any, *args, **kwargs) -> None:
         """Log a debug message with auto-detected module context."""
-        caller = self._get_caller_info()
-        logger = logging.getLogger(caller)
+        logger = self._get_caller_logger()
         logger.debug(msg, *args, **kwargs)
     
     def info(self, msg: Any, *args, **kwargs) -> None:
         """Log an info message with auto-detected module context."""
-        caller = self._get_caller_info()
-        logger = logging.getLogger(caller)
+        logger = self._get_caller_logger()
         logger.info(msg, *args, **kwargs)
     
     def warn(self, msg: Any, *args, **kwargs) -> None:
         """Log a warning message with auto-detected module context."""
-        caller = self._get_caller_info()
-        logger = logging.getLogger(caller)
+        logger = self._get_caller_logger()
         logger.warning(msg, *args, **kwargs)
     
     def warning(self, msg: Any, *args, **kwargs) -> None:
@@ -133,20 +140,17 @@ class ContextAwareLogger:
     
     def error(self, msg: Any, *args, **kwargs) -> None:
         """Log an error message with auto-detected module context."""
-        caller = self._get_caller_info()
-        logger = logging.getLogger(caller)
+        logger = self._get_caller_logger()
         logger.error(msg, *args, **kwargs)
     
     def critical(self, msg: Any, *args, **kwargs) -> None:
         """Log a critical message with auto-detected module context."""
-        caller = self._get_caller_info()
-        logger = logging.getLogger(caller)
+        logger = self._get_caller_logger()
         logger.critical(msg, *args, **kwargs)
     
     def exception(self, msg: Any, *args, exc_info=True, **kwargs) -> None:
         """Log an exception message with auto-detected module context."""
-        caller = self._get_caller_info()
-        logger = logging.getLogger(caller)
+        logger = self._get_caller_logger()
         logger.exception(msg, exc_info=exc_info, **kwargs)
 
     def log_to_file(self, file_path, message, add_timestamp=True, add_newlines=True):
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import functools
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -34,7 +35,12 @@ def get_user_config_dir() -> Path:
     from ares.utils.build.build_utils import BuildUtils
 
     # Get the app name consistently
-    app_name = BuildUtils.get_app_name()
+    return _get_user_config_dir_for(BuildUtils.get_app_name())
+
+@functools.lru_cache(maxsize=8)
+def _get_user_config_dir_for(app_name: str) -> Path:
+    """Resolve and create the configuration directory for an app name once."""
+    from ares.utils.build.build_utils import BuildUtils
     
     # Determine the base directory based on the platform
     if BuildUtils.is_windows():
@@ -77,6 +83,9 @@ class Paths:
     _user_dirs_cache = {}
     _project_cache_path = None
     
+    # Parsed INI files keyed by path, with the (mtime_ns, size) they were read at
+    _ini_cache = {}
+    
     
     @classmethod
     def _initialize(cls):
@@ -433,6 +442,39 @@ class Paths:
         """
         return cls.PROJECT_ROOT / ARES_CHILD_PATH / "config" / INI_DIR_NAME / filename
 
+    @classmethod
+    def load_ini(cls, ini_path):
+        """Parse an INI file, reusing the previous parse while the file is unchanged.
+        
+        Args:
+            ini_path: Path to the INI file
+            
+        Returns:
+            ConfigParser: Parsed file contents; callers must not modify it
+        """
+        import configparser
+        from ares.config._cache import load_or_build
+        
+        ini_path = Path(ini_path)
+        stat = ini_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = cls._ini_cache.get(ini_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+            
+        # Fresh processes start from the prebuilt snapshot of the file
+        try:
+            values = load_or_build(ini_path)
+        except UnicodeDecodeError as e:
+            # Callers handle an undecodable file like any other unparsable one
+            raise configparser.ParsingError(str(ini_path)) from e
+            
+        parser = configparser.ConfigParser()
+        parser.read_dict(values)
+        cls._ini_cache[ini_path] = (key, parser)
+        return parser
+
 
     @classmethod
     def get_python_module_path(cls, relative_path):
@@ -538,9 +580,7 @@ class Paths:
         # Try to read from build.ini file
         ini_path = cls.get_ini_path("build.ini")
         if ini_path and ini_path.exists():  # Add None check
-            import configparser
-            parser = configparser.ConfigParser()
-            parser.read(ini_path)
+            parser = cls.load_ini(ini_path)
             
             if 'cython' in parser and 'module_dirs' in parser['cython']:
                 module_paths_str = parser['cython']['module_dirs']
@@ -26,6 +26,9 @@ def main():
         
         # Draw the frame
         window.present()
+        
+        # Give the rest of the frame back to the OS
+        window.throttle()
     
     # Clean up
     window.close()